@@ -12,6 +12,13 @@ interface Location {
   videoPath: string;
 }
 
+const aggregationSecondsMap: { [key: string]: number } = {
+  '15s': 15,
+  '30s': 30,
+  '5min': 300,
+  '15min': 900
+};
+
 const locations: Location[] = [
   {
     id: '74th-amsterdam-columbus',
@@ -54,14 +61,7 @@ function App() {
   };
 
   const handleExportCSV = (aggregationLevel: string) => {
-    const aggregationMap: { [key: string]: number } = {
-      '15s': 15,
-      '30s': 30,
-      '5min': 300,
-      '15min': 900
-    };
-    
-    const aggregationSeconds = aggregationMap[aggregationLevel];
+    const aggregationSeconds = aggregationSecondsMap[aggregationLevel];
     if (aggregationSeconds) {
       const csv = detectionServiceRef.current.exportToCSV(aggregationSeconds);
       
@@ -102,6 +102,7 @@ function App() {
                 videoPath={selectedLocation.videoPath}
                 onTimeUpdate={handleTimeUpdate}
                 onDetections={handleDetections}
+                detectionService={detectionServiceRef.current}
               />
             </div>
             
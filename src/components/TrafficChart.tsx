@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useMemo } from 'react';
 import {
   LineChart,
   Line,
@@ -29,55 +29,36 @@ const TrafficChart: React.FC<TrafficChartProps> = ({
   detections = [], 
   detectionService 
 }) => {
-  const [data, setData] = useState<TrafficData[]>([]);
-  const [updateInterval, setUpdateInterval] = useState<NodeJS.Timeout | null>(null);
+  // Recompute the aggregated series when new detections arrive or
+  // playback crosses into a new 15-second bucket. The previous version
+  // polled on a 1-second interval that was torn down and recreated on
+  // every timeupdate event, re-aggregating even when nothing changed.
+  const currentBucket = Math.floor(currentTime / 15);
+  const data = useMemo<TrafficData[]>(() => {
+    if (!detectionService) return [];
 
-  useEffect(() => {
-    // Clear previous interval
-    if (updateInterval) {
-      clearInterval(updateInterval);
-    }
-
-    // Update chart data every second
-    const interval = setInterval(() => {
-      if (detectionService) {
-        // Get aggregated data in 15-second intervals
-        const aggregatedData = detectionService.getAggregatedData(0, currentTime + 1, 15);
-        
-        // Add empty data points for future time slots up to 5 minutes
-        const maxTime = Math.max(300, currentTime + 60); // Show at least 5 minutes or current time + 1 minute
-        for (let time = aggregatedData.length * 15; time <= maxTime; time += 15) {
-          aggregatedData.push({
-            time,
-            cars: 0,
-            trucks: 0,
-            buses: 0,
-            motorcycles: 0,
-            bicycles: 0,
-            pedestrians: 0
-          });
-        }
-        
-        setData(aggregatedData);
-      }
-    }, 1000);
-
-    setUpdateInterval(interval);
+    // Get aggregated data in 15-second intervals
+    const endTime = (currentBucket + 1) * 15;
+    const aggregatedData = detectionService.getAggregatedData(0, endTime, 15);
 
-    return () => {
-      if (interval) {
-        clearInterval(interval);
-      }
-    };
-  }, [currentTime, detectionService, locationId]);
-
-  // Update current counts when new detections arrive
-  useEffect(() => {
-    if (detectionService && detections.length > 0) {
-      const currentCount = detectionService.getTrafficCount(detections);
-      console.log('Current traffic count:', currentCount);
+    // Add empty data points for future time slots up to 5 minutes
+    const maxTime = Math.max(300, endTime + 60); // Show at least 5 minutes or current time + 1 minute
+    for (let time = aggregatedData.length * 15; time <= maxTime; time += 15) {
+      aggregatedData.push({
+        time,
+        cars: 0,
+        trucks: 0,
+        buses: 0,
+        motorcycles: 0,
+        bicycles: 0,
+        pedestrians: 0
+      });
     }
-  }, [detections, detectionService]);
+
+    return aggregatedData;
+    // detections is the change signal for the service's mutable history
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [currentBucket, detections, detectionService, locationId]);
 
   const formatTime = (seconds: number) => {
     const mins = Math.floor(seconds / 60);
@@ -85,24 +66,16 @@ const TrafficChart: React.FC<TrafficChartProps> = ({
     return `${mins}:${secs.toString().padStart(2, '0')}`;
   };
 
-  // Calculate totals for display
+  // Calculate totals for display; memoized so the rescan only happens
+  // when the aggregated series changes, not on every timeupdate render
   const currentTotal = detections.length;
-  const overallStats = data.reduce((acc, item) => {
-    acc.cars += item.cars;
-    acc.trucks += item.trucks;
-    acc.buses += item.buses;
-    acc.motorcycles += item.motorcycles;
-    acc.bicycles += item.bicycles;
-    acc.pedestrians += item.pedestrians;
-    return acc;
-  }, {
-    cars: 0,
-    trucks: 0,
-    buses: 0,
-    motorcycles: 0,
-    bicycles: 0,
-    pedestrians: 0
-  });
+  const overallTotal = useMemo(
+    () => data.reduce(
+      (acc, item) => acc + item.cars + item.trucks + item.buses + item.motorcycles + item.bicycles + item.pedestrians,
+      0
+    ),
+    [data]
+  );
 
   return (
     <div style={{ width: '100%', height: '500px' }}>
@@ -120,7 +93,7 @@ const TrafficChart: React.FC<TrafficChartProps> = ({
           <strong>Current Detections:</strong> {currentTotal}
         </div>
         <div>
-          <strong>Total Counted:</strong> {Object.values(overallStats).reduce((a, b) => a + b, 0)}
+          <strong>Total Counted:</strong> {overallTotal}
         </div>
       </div>
       
@@ -8,6 +8,21 @@ interface VideoPlayerProps {
   onDetections?: (detections: Detection[]) => void;
 }
 
+// Class colors are static - look them up from one shared table instead of
+// rebuilding the object on every call
+const CLASS_COLORS: { [key: string]: string } = {
+  'cars': '#FF6B6B',
+  'trucks': '#4ECDC4',
+  'buses': '#45B7D1',
+  'motorcycles': '#FFA500',
+  'bicycles': '#98D8C8',
+  'pedestrians': '#FFD93D'
+};
+
+const getColorForClass = (className: string): string => {
+  return CLASS_COLORS[className] || '#666666';
+};
+
 const VideoPlayer: React.FC<VideoPlayerProps> = ({ videoPath, onTimeUpdate, onDetections }) => {
   const playerRef = useRef<ReactPlayer>(null);
   const canvasRef = useRef<HTMLCanvasElement>(null);
@@ -88,18 +103,6 @@ const VideoPlayer: React.FC<VideoPlayerProps> = ({ videoPath, onTimeUpdate, onDe
     });
   }, []);
   
-  const getColorForClass = (className: string): string => {
-    const colors: { [key: string]: string } = {
-      'cars': '#FF6B6B',
-      'trucks': '#4ECDC4',
-      'buses': '#45B7D1',
-      'motorcycles': '#FFA500',
-      'bicycles': '#98D8C8',
-      'pedestrians': '#FFD93D'
-    };
-    return colors[className] || '#666666';
-  };
-  
   const performDetection = useCallback(async () => {
     if (!isModelLoaded || !videoRef.current || !isDetecting) return;
     
@@ -122,11 +125,8 @@ const VideoPlayer: React.FC<VideoPlayerProps> = ({ videoPath, onTimeUpdate, onDe
       
       try {
         const currentTime = playerRef.current?.getCurrentTime?.() || 0;
-        const allDetections = await detectionService.detectObjects(video, currentTime);
-        
-        // Filter detections by confidence threshold
-        const filteredDetections = allDetections.filter(d => d.score >= confidenceThreshold);
-        
+        const filteredDetections = await detectionService.detectObjects(video, currentTime, confidenceThreshold);
+
         drawBoundingBoxes(filteredDetections);
         
         if (onDetections) {
@@ -141,7 +141,7 @@ const VideoPlayer: React.FC<VideoPlayerProps> = ({ videoPath, onTimeUpdate, onDe
     
     // Schedule next detection
     animationRef.current = requestAnimationFrame(performDetection);
-  }, [isModelLoaded, isDetecting, detectionService, drawBoundingBoxes, onDetections, detectionInterval]);
+  }, [isModelLoaded, isDetecting, detectionService, drawBoundingBoxes, onDetections, detectionInterval, confidenceThreshold]);
   
   useEffect(() => {
     if (isDetecting) {
@@ -204,9 +204,6 @@ const VideoPlayer: React.FC<VideoPlayerProps> = ({ videoPath, onTimeUpdate, onDe
 
   // Adjust video path to be relative to the public directory
   const adjustedPath = videoPath.replace('../', '/');
-  
-  // Log for debugging
-  console.log('Video path:', adjustedPath);
 
   return (
     <div style={{ position: 'relative', width: '100%', maxWidth: '800px' }}>
@@ -5,21 +5,51 @@ interface VideoPlayerProps {
   videoPath: string;
   onTimeUpdate: (time: number) => void;
   onDetections?: (detections: Detection[]) => void;
+  detectionService?: ObjectDetectionService;
 }
 
-const VideoPlayerNative: React.FC<VideoPlayerProps> = ({ videoPath, onTimeUpdate, onDetections }) => {
+// Class colors are static - look them up from one shared table instead of
+// rebuilding the object on every call
+const CLASS_COLORS: { [key: string]: string } = {
+  'cars': '#FF6B6B',
+  'trucks': '#4ECDC4',
+  'buses': '#45B7D1',
+  'motorcycles': '#FFA500',
+  'bicycles': '#98D8C8',
+  'pedestrians': '#FFD93D'
+};
+
+const getColorForClass = (className: string): string => {
+  return CLASS_COLORS[className] || '#666666';
+};
+
+// Label geometry shared between drawing and dirty-rect bookkeeping
+const LABEL_FONT = '14px Arial';
+const LABEL_HEIGHT = 20;
+
+const VideoPlayerNative: React.FC<VideoPlayerProps> = ({
+  videoPath,
+  onTimeUpdate,
+  onDetections,
+  detectionService: sharedService
+}) => {
   const videoRef = useRef<HTMLVideoElement>(null);
   const canvasRef = useRef<HTMLCanvasElement>(null);
-  const [detectionService] = useState(() => new ObjectDetectionService());
+  // Use the service shared by the app so the model is loaded (and warmed)
+  // once; only create a private instance when rendered standalone
+  const [detectionService] = useState(() => sharedService ?? new ObjectDetectionService());
   const [isModelLoaded, setIsModelLoaded] = useState(false);
   const [isDetecting, setIsDetecting] = useState(false);
   const [detectionInterval, setDetectionInterval] = useState<number>(500);
   const [confidenceThreshold, setConfidenceThreshold] = useState<number>(0.5);
+  const [showOverlay, setShowOverlay] = useState(true);
   const [showControls, setShowControls] = useState(false);
   const [modelError, setModelError] = useState<string | null>(null);
   const [videoError, setVideoError] = useState<string | null>(null);
   const animationRef = useRef<number>();
   const lastDetectionTime = useRef<number>(0);
+  const lastProcessedVideoTime = useRef<number>(-1);
+  const lastDrawBounds = useRef<[number, number, number, number] | null>(null);
   
   useEffect(() => {
     // Initialize the detection model
@@ -44,6 +74,7 @@ const VideoPlayerNative: React.FC<VideoPlayerProps> = ({ videoPath, onTimeUpdate
     if (videoRef.current) {
       videoRef.current.currentTime = 0;
     }
+    lastProcessedVideoTime.current = -1;
     detectionService.clearHistory();
   }, [videoPath, detectionService]);
   
@@ -55,45 +86,81 @@ const VideoPlayerNative: React.FC<VideoPlayerProps> = ({ videoPath, onTimeUpdate
     const ctx = canvas.getContext('2d');
     if (!ctx) return;
     
-    // Clear previous drawings
-    ctx.clearRect(0, 0, canvas.width, canvas.height);
-    
-    // Draw each detection
-    detections.forEach(detection => {
+    // Clear only the region the previous frame drew into instead of
+    // wiping the whole canvas
+    const prev = lastDrawBounds.current;
+    if (prev) {
+      ctx.clearRect(prev[0], prev[1], prev[2], prev[3]);
+      lastDrawBounds.current = null;
+    }
+    if (detections.length === 0) return;
+
+    // Group detections by class so stroke/fill colors are set once per
+    // class instead of once per box - canvas state changes flush the
+    // GPU-backed draw queue. Track the union of drawn boxes (including
+    // the label strip above each box) for the next clear.
+    ctx.font = LABEL_FONT;
+    let minX = Infinity;
+    let minY = Infinity;
+    let maxX = 0;
+    let maxY = 0;
+    const byClass = new Map<string, Detection[]>();
+    for (const detection of detections) {
       const [x, y, width, height] = detection.bbox;
-      
-      // Draw bounding box
-      ctx.strokeStyle = getColorForClass(detection.class);
-      ctx.lineWidth = 2;
-      ctx.strokeRect(x, y, width, height);
-      
-      // Draw label background
-      ctx.fillStyle = getColorForClass(detection.class);
-      ctx.fillRect(x, y - 20, width, 20);
-      
-      // Draw label text
-      ctx.fillStyle = 'white';
-      ctx.font = '14px Arial';
-      ctx.fillText(
-        `${detection.class} (${Math.round(detection.score * 100)}%)`,
-        x + 5,
-        y - 5
-      );
+      // Label text is not clipped to the box, so a long label on a
+      // narrow box overhangs it - include the text extent in the union
+      // or the overhang would never be cleared
+      const label = `${detection.class} (${Math.round(detection.score * 100)}%)`;
+      const labelRight = x + 5 + ctx.measureText(label).width;
+      const right = labelRight > x + width ? labelRight : x + width;
+      if (x < minX) minX = x;
+      if (y - LABEL_HEIGHT < minY) minY = y - LABEL_HEIGHT;
+      if (right > maxX) maxX = right;
+      if (y + height > maxY) maxY = y + height;
+      const group = byClass.get(detection.class);
+      if (group) {
+        group.push(detection);
+      } else {
+        byClass.set(detection.class, [detection]);
+      }
+    }
+    // Pad for the 2px stroke so cleared bounds cover the line width
+    lastDrawBounds.current = [minX - 2, minY - 2, maxX - minX + 4, maxY - minY + 4];
+
+    // Accumulate each class's boxes into one Path2D so the context does
+    // a single stroke and a single fill per class rather than two draw
+    // calls per box
+    ctx.lineWidth = 2;
+    byClass.forEach((group, className) => {
+      const boxes = new Path2D();
+      const labelBackgrounds = new Path2D();
+      for (const detection of group) {
+        const [x, y, width, height] = detection.bbox;
+        boxes.rect(x, y, width, height);
+        labelBackgrounds.rect(x, y - LABEL_HEIGHT, width, LABEL_HEIGHT);
+      }
+      const color = getColorForClass(className);
+      ctx.strokeStyle = color;
+      ctx.fillStyle = color;
+      ctx.stroke(boxes);
+      ctx.fill(labelBackgrounds);
+    });
+
+    // Draw all label text in a second pass with a single white fill;
+    // the font was already set for the measurement pass above
+    ctx.fillStyle = 'white';
+    byClass.forEach((group, className) => {
+      for (const detection of group) {
+        const [x, y] = detection.bbox;
+        ctx.fillText(
+          `${className} (${Math.round(detection.score * 100)}%)`,
+          x + 5,
+          y - 5
+        );
+      }
     });
   }, []);
   
-  const getColorForClass = (className: string): string => {
-    const colors: { [key: string]: string } = {
-      'cars': '#FF6B6B',
-      'trucks': '#4ECDC4',
-      'buses': '#45B7D1',
-      'motorcycles': '#FFA500',
-      'bicycles': '#98D8C8',
-      'pedestrians': '#FFD93D'
-    };
-    return colors[className] || '#666666';
-  };
-  
   const performDetection = useCallback(async () => {
     if (!isModelLoaded || !videoRef.current || !isDetecting) return;
     
@@ -113,27 +180,32 @@ const VideoPlayerNative: React.FC<VideoPlayerProps> = ({ videoPath, onTimeUpdate
         canvas.height = video.videoHeight;
       }
       
-      try {
-        const currentTime = video.currentTime;
-        const allDetections = await detectionService.detectObjects(video, currentTime);
-        
-        // Filter detections by confidence threshold
-        const filteredDetections = allDetections.filter(d => d.score >= confidenceThreshold);
-        
-        drawBoundingBoxes(filteredDetections);
-        
-        if (onDetections) {
-          onDetections(filteredDetections);
+      const currentTime = video.currentTime;
+      // If the presentation timestamp hasn't advanced since the last
+      // pass, no new frame was decoded (buffering stall) and the model
+      // would just recompute identical boxes - skip the inference
+      if (currentTime !== lastProcessedVideoTime.current) {
+        try {
+          const filteredDetections = await detectionService.detectObjects(video, currentTime, confidenceThreshold);
+
+          // With the overlay off, drawing an empty set just erases any
+          // leftover boxes; counting and export still see every detection
+          drawBoundingBoxes(showOverlay ? filteredDetections : []);
+
+          if (onDetections) {
+            onDetections(filteredDetections);
+          }
+
+          lastProcessedVideoTime.current = currentTime;
+          lastDetectionTime.current = now;
+        } catch (error) {
+          console.error('Detection error:', error);
         }
-        
-        lastDetectionTime.current = now;
-      } catch (error) {
-        console.error('Detection error:', error);
       }
     }
     
     animationRef.current = requestAnimationFrame(performDetection);
-  }, [isModelLoaded, isDetecting, detectionService, drawBoundingBoxes, onDetections, detectionInterval, confidenceThreshold]);
+  }, [isModelLoaded, isDetecting, detectionService, drawBoundingBoxes, onDetections, detectionInterval, confidenceThreshold, showOverlay]);
   
   useEffect(() => {
     if (isDetecting) {
@@ -175,7 +247,6 @@ const VideoPlayerNative: React.FC<VideoPlayerProps> = ({ videoPath, onTimeUpdate
 
   // Adjust video path to be relative to the public directory
   const adjustedPath = videoPath.replace('../', '/');
-  console.log('Video path:', adjustedPath);
 
   return (
     <div style={{ position: 'relative', width: '100%', maxWidth: '800px' }}>
@@ -312,6 +383,16 @@ const VideoPlayerNative: React.FC<VideoPlayerProps> = ({ videoPath, onTimeUpdate
           
           {showControls && (
             <div style={{ marginTop: '10px', display: 'flex', flexDirection: 'column', gap: '8px' }}>
+              <div>
+                <label style={{ display: 'flex', alignItems: 'center', gap: '6px' }}>
+                  <input
+                    type="checkbox"
+                    checked={showOverlay}
+                    onChange={(e) => setShowOverlay(e.target.checked)}
+                  />
+                  Show bounding boxes
+                </label>
+              </div>
               <div>
                 <label style={{ display: 'block', marginBottom: '2px' }}>
                   Detection Interval: {detectionInterval}ms
@@ -42,9 +42,4 @@ export function analyzeExcelStructure() {
     console.error('Error reading Excel file:', error);
     throw error;
   }
-}
-
-// Run the analysis if this file is executed directly
-if (require.main === module) {
-  analyzeExcelStructure();
 }
\ No newline at end of file